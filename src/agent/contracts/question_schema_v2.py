@@ -26,7 +26,7 @@ class Urgency(str, Enum):
     CRITICAL = "critical"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Condition:
     """Conditional display: show question only if a previous answer matches."""
     depends_on: str
@@ -52,12 +52,18 @@ class Condition:
         return False
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Option:
     id: str
     label: str
     description: str = ""
     icon: str = ""
+    _display_line: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Options are immutable, so their text-fallback line is rendered once
+        desc = f" - {self.description}" if self.description else ""
+        object.__setattr__(self, "_display_line", f"  {self.id}) {self.label}{desc}\n")
 
     def to_dict(self) -> dict:
         d = {"id": self.id, "label": self.label}
@@ -68,7 +74,7 @@ class Option:
         return d
 
 
-@dataclass
+@dataclass(slots=True)
 class Question:
     id: str
     question: str
@@ -80,6 +86,11 @@ class Question:
     default_value: str = ""
     condition: Optional[Condition] = None
 
+    def __post_init__(self):
+        # Share the enum singletons instead of keeping raw type strings around
+        if not isinstance(self.type, QuestionType):
+            self.type = QuestionType(self.type)
+
     def to_dict(self) -> dict:
         d = {
             "id": self.id,
@@ -104,7 +115,7 @@ class Question:
         return d
 
 
-@dataclass
+@dataclass(slots=True)
 class QuestionSet:
     """A set of questions ready to send to the frontend."""
     worker: str
@@ -136,26 +147,26 @@ class QuestionSet:
 
     def to_display_text(self, current_step: int = 0) -> str:
         """Text fallback for worker_output.content."""
-        lines = []
+        if current_step > 0 and self.wizard_mode and self.on_complete and current_step >= len(self.questions):
+            # Wizard already finished: only the completion message is left to show
+            return self.on_complete
+        parts = []
         if self.title:
-            lines.append(f"## {self.title}\n")
+            parts.append(f"## {self.title}\n")
         if self.context:
-            lines.append(f"{self.context}\n")
-        for i, q in enumerate(self.questions, 1):
-            lines.append(f"**Pregunta {i}:** {q.question}")
-            if q.options:
-                for opt in q.options:
-                    desc = f" - {opt.description}" if opt.description else ""
-                    lines.append(f"  {opt.id}) {opt.label}{desc}")
-            lines.append("")
-        return "\n".join(lines)
+            parts.append(f"{self.context}\n")
+        parts.extend(
+            f"**Pregunta {i}:** {q.question}\n" + "".join(o._display_line for o in q.options)
+            for i, q in enumerate(self.questions, 1)
+        )
+        return "\n".join(parts)
 
     def model_dump_json(self) -> str:
         """Backward compat: JSON string for pending_context."""
         return json.dumps(self.to_interrupt_payload(), ensure_ascii=False)
 
 
-@dataclass
+@dataclass(slots=True)
 class AnswerSet:
     """Parsed answers from the frontend resume payload."""
     answers: Dict[str, Any] = field(default_factory=dict)
@@ -218,6 +229,11 @@ class AnswerSet:
         return "\n".join(f"{k}: {v}" for k, v in self.answers.items())
 
 
+# Options are frozen, so these fixed options are shared by every builder/registry question
+_OPTION_OTHER = Option(id="other", label="Otro (especificar)")
+_OPTIONS_YES_NO = (Option(id="yes", label="Sí"), Option(id="no", label="No"))
+
+
 class QuestionBuilder:
     """Fluent API to build QuestionSets."""
 
@@ -264,7 +280,7 @@ class QuestionBuilder:
             elif len(opt) >= 3:
                 opts.append(Option(id=str(opt[0]), label=str(opt[1]), description=str(opt[2])))
         if include_other:
-            opts.append(Option(id="other", label="Otro (especificar)"))
+            opts.append(_OPTION_OTHER)
         self._questions.append(Question(
             id=id, question=question, type=QuestionType.CHOICE,
             options=opts, required=required, help_text=help_text, condition=condition,
@@ -288,7 +304,7 @@ class QuestionBuilder:
     ) -> "QuestionBuilder":
         self._questions.append(Question(
             id=id, question=question, type=QuestionType.BOOLEAN,
-            options=[Option(id="yes", label="Sí"), Option(id="no", label="No")],
+            options=list(_OPTIONS_YES_NO),
             required=required, help_text=help_text, condition=condition,
         ))
         return self
@@ -363,7 +379,7 @@ def _build_troubleshooting_registry() -> QuestionRegistry:
             Option(id="2", label="S7-1500", description="Serie avanzada"),
             Option(id="3", label="S7-300", description="Serie clásica"),
             Option(id="4", label="S7-400", description="Serie de alto rendimiento"),
-            Option(id="other", label="Otro (especificar)"),
+            _OPTION_OTHER,
         ],
         help_text="Lo puedes encontrar en la etiqueta frontal del equipo",
     ))
@@ -378,7 +394,7 @@ def _build_troubleshooting_registry() -> QuestionRegistry:
             Option(id="3", label="V17"),
             Option(id="4", label="V18"),
             Option(id="5", label="V19", description="Última versión"),
-            Option(id="other", label="Otro (especificar)"),
+            _OPTION_OTHER,
         ],
         help_text="Menú Ayuda → Acerca de TIA Portal",
     ))
@@ -391,7 +407,7 @@ def _build_troubleshooting_registry() -> QuestionRegistry:
             Option(id="1", label="Cable directo PC-PLC", description="Conexión punto a punto"),
             Option(id="2", label="A través de switch/router", description="Red local"),
             Option(id="3", label="Red corporativa/VPN", description="Conexión remota"),
-            Option(id="other", label="Otro (especificar)"),
+            _OPTION_OTHER,
         ],
         help_text="Esto ayuda a identificar problemas de comunicación",
     ))
@@ -400,7 +416,7 @@ def _build_troubleshooting_registry() -> QuestionRegistry:
         id="worked_before",
         question="¿El PLC funcionaba correctamente antes de este problema?",
         type=QuestionType.BOOLEAN,
-        options=[Option(id="yes", label="Sí"), Option(id="no", label="No")],
+        options=list(_OPTIONS_YES_NO),
         help_text="Nos ayuda a saber si es un problema nuevo o recurrente",
     ))
 
@@ -430,7 +446,7 @@ def _build_troubleshooting_registry() -> QuestionRegistry:
             Option(id="2", label="STOP amarillo/rojo", description="CPU detenida"),
             Option(id="3", label="ERROR parpadeando", description="Hay un fallo"),
             Option(id="4", label="Todos apagados", description="Sin alimentación"),
-            Option(id="other", label="Otro (especificar)"),
+            _OPTION_OTHER,
         ],
         help_text="Los LEDs del frente indican el estado del equipo",
     ))
@@ -454,6 +470,17 @@ def _build_troubleshooting_registry() -> QuestionRegistry:
 
 troubleshooting_registry = _build_troubleshooting_registry()
 
+# missing-info keyword -> troubleshooting_registry key, checked in this order
+_INFO_KEYWORDS = (
+    ("modelo", "plc_model"), ("plc", "plc_model"),
+    ("version", "tia_version"), ("tia", "tia_version"),
+    ("error", "error_message"), ("mensaje", "error_message"),
+    ("conexion", "connection_type"), ("conexión", "connection_type"),
+    ("led", "led_status"),
+    ("cambios", "recent_changes"),
+    ("urgencia", "urgency"),
+)
+
 
 def quick_questions(
     worker: str,
@@ -462,22 +489,12 @@ def quick_questions(
     max_questions: int = 5,
 ) -> QuestionSet:
     """Generate a QuestionSet from predefined templates based on missing info keys."""
-    info_to_key = {
-        "modelo": "plc_model", "plc": "plc_model",
-        "version": "tia_version", "tia": "tia_version",
-        "error": "error_message", "mensaje": "error_message",
-        "conexion": "connection_type", "conexión": "connection_type",
-        "led": "led_status",
-        "cambios": "recent_changes",
-        "urgencia": "urgency",
-    }
-
     questions: List[Question] = []
     added: set = set()
 
     for info in missing_info:
         info_lower = info.lower()
-        for keyword, question_key in info_to_key.items():
+        for keyword, question_key in _INFO_KEYWORDS:
             if keyword in info_lower and question_key not in added:
                 q = troubleshooting_registry.get(question_key)
                 if q:
@@ -500,7 +517,8 @@ def quick_questions(
         builder.wizard(allow_skip=True)
     builder.on_complete("Gracias. Ya tengo la información necesaria para analizar tu problema.")
 
-    for q in questions[:max_questions]:
+    del questions[max_questions:]  # trim in place instead of slicing a copy
+    for q in questions:
         builder.add_question(q)
 
     return builder.build()
@@ -5,15 +5,25 @@ Universal contract for worker-supervisor communication.
 All workers must return WorkerOutput for the supervisor to accumulate
 evidence, detect HITL needs, and chain multi-step orchestration.
 """
-import uuid
-import json
-from typing import List, Optional, Literal, Any, Dict
-from pydantic import BaseModel, Field
+import os
+from typing import List, Optional, Literal, Any, Dict, Union
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 from datetime import datetime
 
 
+def _utcnow_iso() -> str:
+    return datetime.utcnow().isoformat()
+
+
+def _new_task_id() -> str:
+    """Random 128-bit task id as 32 hex chars (no UUID object round trip)."""
+    return os.urandom(16).hex()
+
+
 class EvidenceItem(BaseModel):
     """A retrieved evidence fragment (primarily from RAG)."""
+    model_config = ConfigDict(frozen=True)
+
     source_id: Optional[str] = Field(default=None, description="ID del chunk/documento")
     title: str = Field(default="", description="Título del documento fuente")
     chunk: str = Field(default="", description="Contenido del fragmento")
@@ -24,6 +34,8 @@ class EvidenceItem(BaseModel):
 
 class ActionItem(BaseModel):
     """Suggested action for the orchestrator."""
+    model_config = ConfigDict(frozen=True)
+
     type: Literal["ask_user", "call_worker", "call_tool", "end"]
     target: Optional[str] = Field(default=None, description="Nombre del worker/tool objetivo")
     payload: Dict[str, Any] = Field(default_factory=dict, description="Datos para la acción")
@@ -33,6 +45,8 @@ class ActionItem(BaseModel):
 
 class ErrorItem(BaseModel):
     """Structured error for debugging."""
+    model_config = ConfigDict(frozen=True)
+
     code: str = Field(description="Código del error (ej: 'RAG_NO_RESULTS')")
     message: str = Field(description="Mensaje legible del error")
     severity: Literal["warning", "error", "critical"] = Field(default="error")
@@ -42,7 +56,7 @@ class ErrorItem(BaseModel):
 
 class WorkerMetadata(BaseModel):
     """Execution metadata common to all workers."""
-    started_at: str = Field(default_factory=lambda: datetime.utcnow().isoformat())
+    started_at: str = Field(default_factory=_utcnow_iso)
     completed_at: Optional[str] = None
     tokens_used: int = Field(default=0, description="Tokens consumidos")
     model_used: str = Field(default="", description="Modelo LLM usado")
@@ -54,7 +68,7 @@ class WorkerOutput(BaseModel):
     """Universal output contract for all workers."""
 
     worker: Literal["chat", "research", "tutor", "troubleshooting", "summarizer", "robot_operator", "analysis", "practice"]
-    task_id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    task_id: str = Field(default_factory=_new_task_id)
     
     status: Literal["ok", "needs_context", "partial", "error"] = Field(
         default="ok",
@@ -108,11 +122,11 @@ class WorkerOutput(BaseModel):
         description="Datos adicionales específicos del worker"
     )
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "worker": "research",
-                "task_id": "550e8400-e29b-41d4-a716-446655440000",
+                "task_id": "550e8400e29b41d4a716446655440000",
                 "status": "ok",
                 "summary": "Encontré 3 documentos relevantes sobre métricas RAGAS",
                 "content": "Según el paper FrEDie...",
@@ -135,6 +149,12 @@ class WorkerOutput(BaseModel):
                 ]
             }
         }
+    )
+
+
+# Compiled once; validate whole lists in pydantic-core instead of per-item constructors
+_EVIDENCE_LIST_ADAPTER = TypeAdapter(List[EvidenceItem])
+_ACTION_LIST_ADAPTER = TypeAdapter(List[ActionItem])
 
 
 def serialize_worker_output(output: WorkerOutput) -> str:
@@ -144,9 +164,8 @@ def serialize_worker_output(output: WorkerOutput) -> str:
 def parse_worker_output(json_str: str) -> Optional[WorkerOutput]:
     """Parse JSON string to WorkerOutput, returns None on failure."""
     try:
-        data = json.loads(json_str)
-        return WorkerOutput(**data)
-    except (json.JSONDecodeError, ValueError) as e:
+        return WorkerOutput.model_validate_json(json_str)
+    except ValueError as e:
         print(f"[WorkerContract] Error parseando output: {e}")
         return None
 
@@ -157,13 +176,14 @@ def create_error_output(
     error_message: str,
     debug_info: Optional[Dict] = None
 ) -> WorkerOutput:
-    return WorkerOutput(
+    # Built from trusted internal values: skip validation, defaults still apply
+    return WorkerOutput.model_construct(
         worker=worker,
         status="error",
         summary=f"Error: {error_message[:50]}",
         content=f"Ocurrió un error durante el procesamiento: {error_message}",
         errors=[
-            ErrorItem(
+            ErrorItem.model_construct(
                 code=error_code,
                 message=error_message,
                 debug=debug_info or {},
@@ -201,7 +221,8 @@ def create_needs_context_output(
             "show_progress": True
         }
 
-    return WorkerOutput(
+    # Built from trusted internal values: skip validation, defaults still apply
+    return WorkerOutput.model_construct(
         worker=worker,
         status="needs_context",
         summary="Se necesita más información del usuario",
@@ -264,23 +285,16 @@ class WorkerOutputBuilder:
     @staticmethod
     def research(
         content: str,
-        evidence: List[Dict] = None,
+        evidence: List[Union[Dict, EvidenceItem]] = None,
         summary: str = "",
         confidence: float = 0.8,
         status: str = "ok",
-        next_actions: List[Dict] = None,
+        next_actions: List[Union[Dict, ActionItem]] = None,
         **kwargs
     ) -> WorkerOutput:
-        evidence_items = []
-        if evidence:
-            for ev in evidence:
-                evidence_items.append(EvidenceItem(**ev))
-        
-        action_items = []
-        if next_actions:
-            for action in next_actions:
-                action_items.append(ActionItem(**action))
-        
+        evidence_items = _EVIDENCE_LIST_ADAPTER.validate_python(evidence) if evidence else []
+        action_items = _ACTION_LIST_ADAPTER.validate_python(next_actions) if next_actions else []
+
         return WorkerOutput(
             worker="research",
             status=status,
@@ -4,7 +4,9 @@ graph.py - Main orchestration graph.
 START -> bootstrap -> planner -> [worker -> route -> ...] -> synthesize -> END
 """
 import logging
+import os
 from enum import StrEnum
+from functools import lru_cache
 
 from langgraph.graph import StateGraph, END, START
 
@@ -79,8 +81,11 @@ VALID_WORKERS = CORE_WORKERS | SPECIAL_WORKERS
 
 ALL_NODES = {n.value for n in Node}
 
+_PLANNER_DESTINATIONS = frozenset(VALID_WORKERS | {"END"})
+_ROUTE_DESTINATIONS = frozenset(VALID_WORKERS | {Node.SYNTHESIZE, Node.HUMAN_INPUT, "END"})
 
-def _normalize_destination(next_node: str, allowed: set[str], fallback: str) -> str:
+
+def _normalize_destination(next_node: str, allowed: frozenset[str], fallback: str) -> str:
     """Validate and normalize a graph destination."""
     if next_node in allowed:
         return next_node
@@ -90,9 +95,14 @@ def _normalize_destination(next_node: str, allowed: set[str], fallback: str) ->
     return fallback
 
 
+@lru_cache(maxsize=1)
+def _verification_required() -> bool:
+    """REQUIRE_VERIFICATION is fixed for the process; tests can cache_clear()."""
+    return os.getenv("REQUIRE_VERIFICATION", "false").lower() == "true"
+
+
 def route_after_bootstrap(state: AgentState) -> str:
-    import os
-    if os.getenv("REQUIRE_VERIFICATION", "false").lower() == "true" and not state.get("customer_id"):
+    if _verification_required() and not state.get("customer_id"):
         return Node.VERIFY_INFO
     return Node.PLANNER
 
@@ -112,7 +122,7 @@ def route_after_verify(state: AgentState) -> str:
 def route_from_planner(state: AgentState) -> str:
     """Routes from planner to first worker or END."""
     next_node = state.get("next", Node.CHAT)
-    return _normalize_destination(next_node, VALID_WORKERS | {"END"}, Node.CHAT)
+    return _normalize_destination(next_node, _PLANNER_DESTINATIONS, Node.CHAT)
 
 
 def route_from_orchestrator(state: AgentState) -> str:
@@ -121,8 +131,7 @@ def route_from_orchestrator(state: AgentState) -> str:
         return Node.HUMAN_INPUT
 
     next_node = state.get("next", "END")
-    allowed = VALID_WORKERS | {Node.SYNTHESIZE, Node.HUMAN_INPUT, "END"}
-    return _normalize_destination(next_node, allowed, "END")
+    return _normalize_destination(next_node, _ROUTE_DESTINATIONS, "END")
 
 
 def route_after_human_input(state: AgentState) -> str:
@@ -199,20 +208,29 @@ def _register_edges(workflow: StateGraph, enable_verification: bool):
     workflow.add_conditional_edges(Node.HUMAN_INPUT, route_after_human_input, hi_edges)
 
 
-def create_graph(enable_verification: bool = False) -> StateGraph:
-    """Create the main orchestration graph (no checkpointer)."""
+@lru_cache(maxsize=2)
+def _build_workflow(enable_verification: bool) -> StateGraph:
+    """Wire nodes and edges once per verification mode; compile() reads it without mutating."""
     workflow = StateGraph(AgentState)
     _register_nodes(workflow, enable_verification)
     _register_edges(workflow, enable_verification)
-    return workflow.compile()
+    return workflow
+
+
+@lru_cache(maxsize=2)
+def _compiled(enable_verification: bool) -> StateGraph:
+    return _build_workflow(enable_verification).compile()
+
+
+def create_graph(enable_verification: bool = False) -> StateGraph:
+    """Create the main orchestration graph (no checkpointer). Compiled once per mode."""
+    # Normalized positional key: one cache entry per mode however callers spell it
+    return _compiled(bool(enable_verification))
 
 
 def create_graph_with_checkpointer(checkpointer=None, enable_verification: bool = False):
     """Create the main orchestration graph with an external checkpointer."""
-    workflow = StateGraph(AgentState)
-    _register_nodes(workflow, enable_verification)
-    _register_edges(workflow, enable_verification)
-    return workflow.compile(checkpointer=checkpointer)
+    return _build_workflow(bool(enable_verification)).compile(checkpointer=checkpointer)
 
 
 graph = create_graph(enable_verification=False)
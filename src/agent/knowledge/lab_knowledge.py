@@ -4,6 +4,8 @@ lab_knowledge.py
 Base knowledge about the FrED Factory lab: equipment, stations, terminology,
 safety procedures, and common errors. Edit constants to match your lab config.
 """
+from functools import lru_cache
+from typing import Optional
 
 
 LAB_NAME = "Laboratorio FrED Factory"
@@ -238,8 +240,10 @@ COMMON_ERRORS = {
 }
 
 
+_lab_knowledge_summary: Optional[str] = None
 
-def get_lab_knowledge_summary() -> str:
+
+def _build_lab_knowledge_summary() -> str:
     """Build a lab knowledge summary for injection into prompts."""
     robots_list = []
     for name, info in ROBOTS.items():
@@ -249,22 +253,28 @@ def get_lab_knowledge_summary() -> str:
     for num, info in STATIONS.items():
         stations_list.append(f"- **Estación {num}** - {info['nombre']}: {info['descripcion'][:80]}...")
     
-    return f"""## Conocimiento del Laboratorio
+    terms_list = [f"- **{k}**: {v}" for k, v in list(TERMINOLOGY.items())[:10]]
 
-### Descripción General
-{LAB_DESCRIPTION.strip()}
+    return "\n\n".join((
+        "## Conocimiento del Laboratorio",
+        "### Descripción General\n" + LAB_DESCRIPTION.strip(),
+        "### Robots Disponibles\n" + "\n".join(robots_list),
+        "### Estaciones de Trabajo\n" + "\n".join(stations_list),
+        "### Terminología Clave\n" + "\n".join(terms_list),
+    )) + "\n"
 
-### Robots Disponibles
-{chr(10).join(robots_list)}
 
-### Estaciones de Trabajo
-{chr(10).join(stations_list)}
+def get_lab_knowledge_summary() -> str:
+    """Get the lab knowledge summary, built on first call and reused afterwards."""
+    global _lab_knowledge_summary
 
-### Terminología Clave
-{chr(10).join([f"- **{k}**: {v}" for k, v in list(TERMINOLOGY.items())[:10]])}
-"""
+    if _lab_knowledge_summary is None:
+        _lab_knowledge_summary = _build_lab_knowledge_summary()
 
+    return _lab_knowledge_summary
 
+
+@lru_cache(maxsize=128)
 def get_robot_info(robot_name: str) -> str:
     """Get detailed info for a specific robot."""
     robot_name_upper = robot_name.upper()
@@ -290,6 +300,7 @@ def get_robot_info(robot_name: str) -> str:
     return f"No se encontró información sobre el robot '{robot_name}'"
 
 
+@lru_cache(maxsize=128)
 def get_station_info(station_number: int) -> str:
     """Get detailed info for a station by number."""
     if station_number in STATIONS:
@@ -312,22 +323,31 @@ def get_station_info(station_number: int) -> str:
     return f"No se encontró información sobre la estación {station_number}"
 
 
+# Precomputed once: exact lookups by upper/lower-cased key (built in reverse so
+# the first key wins, as in a linear scan) and pre-lowered text for substrings
+_TERM_BY_UPPER = {k.upper(): k for k in reversed(TERMINOLOGY)}
+_TERM_BY_LOWER = {k.lower(): k for k in reversed(TERMINOLOGY)}
+_TERM_SEARCH = tuple((k, k.lower(), v.lower()) for k, v in TERMINOLOGY.items())
+
+
 def get_terminology_definition(term: str) -> str:
     """Look up a term definition (exact or partial match)."""
-    term_upper = term.upper()
     term_lower = term.lower()
-    
-    for key, value in TERMINOLOGY.items():
-        if key.upper() == term_upper or key.lower() == term_lower:
-            return f"**{key}**: {value}"
-    
-    for key, value in TERMINOLOGY.items():
-        if term_lower in key.lower() or term_lower in value.lower():
-            return f"**{key}**: {value}"
-    
+
+    key = _TERM_BY_UPPER.get(term.upper()) or _TERM_BY_LOWER.get(term_lower)
+    if key is None:
+        for candidate, key_lower, value_lower in _TERM_SEARCH:
+            if term_lower in key_lower or term_lower in value_lower:
+                key = candidate
+                break
+
+    if key is not None:
+        return f"**{key}**: {TERMINOLOGY[key]}"
+
     return f"No se encontró definición para '{term}'"
 
 
+@lru_cache(maxsize=128)
 def get_error_solution(error_code: str) -> str:
     """Get error description, causes, and recommended solution."""
     error_upper = error_code.upper()
@@ -428,7 +428,7 @@ def research_node(state: AgentState) -> Dict[str, Any]:
 
     output = WorkerOutputBuilder.research(
         content=answer,
-        evidence=[ev.model_dump() for ev in all_evidence],
+        evidence=all_evidence,
         summary=summary,
         confidence=confidence,
         status=status,
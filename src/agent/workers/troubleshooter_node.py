@@ -1106,6 +1106,17 @@ Could you please rephrase your request?"""
     }
 
 
+# Fixed fallback wizard for very short messages; built once and only read afterwards
+_BRIEF_MESSAGE_QUESTIONS = (
+    QuestionBuilder("troubleshooting")
+    .context("Tu mensaje es un poco breve. Para ayudarte mejor:")
+    .text("more_details",
+          "Could you give me more details about your query?",
+          placeholder="Describe el problema o lo que necesitas...")
+    .build()
+)
+
+
 def _try_request_clarification(ctx: TroubleshooterContext) -> Optional[Dict[str, Any]]:
     """Returns a HITL dict if clarification questions were generated, else None."""
     logger.info("troubleshooter_node", f"[HANDLER] try_clarification: msg_len={len(ctx.user_message)} is_lab={ctx.is_lab}")
@@ -1135,14 +1146,7 @@ def _try_request_clarification(ctx: TroubleshooterContext) -> Optional[Dict[str,
 
     # Generic fallback for very short messages
     if not question_set and len(ctx.user_message.split()) < 10:
-        question_set = (
-            QuestionBuilder("troubleshooting")
-            .context("Tu mensaje es un poco breve. Para ayudarte mejor:")
-            .text("more_details",
-                  "Could you give me more details about your query?",
-                  placeholder="Describe el problema o lo que necesitas...")
-            .build()
-        )
+        question_set = _BRIEF_MESSAGE_QUESTIONS
 
     if question_set:
         payload = question_set.to_interrupt_payload()